@@ -10,7 +10,7 @@ def test_tile_validation():
     test_path = "tests/_test_data/small_tiff.tiff"
     wsi = WSI(test_path)
 
-    with pytest.raises(TypeError, match="Image must be a numpy array."):
+    with pytest.raises(ValueError, match="Image must be a 3D numpy array."):
         Tile(123, 0, 0, 0, wsi)
     with pytest.raises(ValueError, match="Image must be a 3D numpy array."):
         Tile(np.zeros((10, 10)), 0, 0, 0, wsi)
@@ -35,3 +35,68 @@ def test_tile_validation():
         Tile(img, 0, 0, 123, wsi)
     with pytest.raises(TypeError, match="Parent WSI must be a WSI object."):
         Tile(img, 0, 0, 0, 123)
+
+
+def test_tile_uint8_normalization():
+    test_path = "tests/_test_data/small_tiff.tiff"
+    wsi = WSI(test_path)
+    img = np.full((10, 10, 3), 51, dtype=np.uint8)
+    tile = Tile(img, 0, 0, 0, wsi)
+    assert tile.image.dtype == np.float32
+    assert np.allclose(tile.image, 51 / 255)
+
+
+def test_tile_from_batch():
+    test_path = "tests/_test_data/small_tiff.tiff"
+    wsi = WSI(test_path)
+    imgs = np.full((4, 10, 10, 3), 51, dtype=np.uint8)
+    ys = np.array([0, 10, 20, 30])
+    xs = np.array([0, 0, 10, 10])
+    tiles = Tile.from_batch(imgs, ys, xs, 0, wsi)
+    assert len(tiles) == 4
+    assert tiles[1].y_start == 10
+    assert tiles[2].x_start == 10
+    assert tiles[0].image.dtype == np.float32
+    assert np.allclose(tiles[0].image, 51 / 255)
+    with pytest.raises(ValueError, match="Images must be a 4D numpy array."):
+        Tile.from_batch(imgs[0], ys, xs, 0, wsi)
+    with pytest.raises(ValueError, match="Y starts must have one entry per image."):
+        Tile.from_batch(imgs, ys[:2], xs, 0, wsi)
+    with pytest.raises(TypeError, match="Y starts must be integers."):
+        Tile.from_batch(imgs, ys.astype(np.float64), xs, 0, wsi)
+    with pytest.raises(TypeError, match="X starts must be integers."):
+        Tile.from_batch(imgs, ys, xs.astype(np.float64), 0, wsi)
+
+
+def test_tile_lazy_uint8_image():
+    test_path = "tests/_test_data/small_tiff.tiff"
+    wsi = WSI(test_path)
+    img = np.full((10, 10, 3), 51, dtype=np.uint8)
+    tile = Tile(img, 0, 0, 0, wsi)
+    assert tile.image_u8 is img
+    assert tile.image.dtype == np.float32
+    assert tile.image is tile.image
+    float_tile = Tile(np.zeros((10, 10, 3)), 0, 0, 0, wsi)
+    with pytest.raises(ValueError, match="Tile does not hold uint8 image data."):
+        float_tile.image_u8
+
+
+def test_tile_image_read_only():
+    test_path = "tests/_test_data/small_tiff.tiff"
+    wsi = WSI(test_path)
+    tile = Tile(np.full((10, 10, 3), 51, dtype=np.uint8), 0, 0, 0, wsi)
+    assert not tile.image_u8.flags.writeable
+    assert not tile.image.flags.writeable
+    float_tile = Tile(np.zeros((10, 10, 3)), 0, 0, 0, wsi)
+    assert not float_tile.image.flags.writeable
+
+
+def test_tile_float_dtypes():
+    test_path = "tests/_test_data/small_tiff.tiff"
+    wsi = WSI(test_path)
+    for dtype in (np.float16, np.float32, np.float64, np.longdouble):
+        tile = Tile(np.full((10, 10, 3), 0.5, dtype=dtype), 0, 0, 0, wsi)
+        assert tile.image.dtype == np.float32
+        assert np.allclose(tile.image, 0.5)
+    with pytest.raises(ValueError, match=r"Image must be normalized to \[0, 1\]."):
+        Tile(np.full((10, 10, 3), 2.0, dtype=np.float16), 0, 0, 0, wsi)
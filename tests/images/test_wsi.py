@@ -22,5 +22,5 @@ def test_wsi_validation():
 def test_wsi_pixels_from_microns():
     test_path = "tests/_test_data/small_tiff.tiff"
     wsi = WSI(test_path)
-    assert wsi.pixels_from_microns(123, 0) == 123 / 0.499
+    assert wsi.pixels_from_microns(123, 0) == pytest.approx(123 / 0.499)
 
@@ -0,0 +1,93 @@
+"""
+Ahead-of-time compiles the tile validation kernels with ``numba.pycc``.
+
+Running ``python -m wsimorph._utils._compile_kernels`` builds a
+``_wsimorph_kernels`` extension module inside ``wsimorph/images``;
+wheels built afterwards ship the extension via the ``include`` entry in
+``pyproject.toml``.
+When present, ``wsimorph.images._tile_kernels`` imports the compiled
+kernels instead of the ``@njit`` definitions, eliminating the JIT warm-up
+cost on the first tile. Note that ``numba.pycc`` does not support
+``parallel=True``, so the AOT variants are serial; for short jobs the
+avoided compilation latency outweighs the lost ``prange`` parallelism.
+"""
+from pathlib import Path
+
+import numpy as np
+from numba import types
+from numba.pycc import CC
+
+cc = CC("_wsimorph_kernels")
+cc.output_dir = str(Path(__file__).resolve().parent.parent / "images")
+
+_f4_3d_c = types.Array(types.float32, 3, "C")
+_u1_3d = types.Array(types.uint8, 3, "A")
+_u2_3d = types.Array(types.uint16, 3, "A")
+_f4_3d = types.Array(types.float32, 3, "A")
+_f8_3d = types.Array(types.float64, 3, "A")
+_unit_f32 = types.Tuple((_f4_3d_c, types.float32, types.float32))
+
+_LUT_U8 = np.arange(256, dtype=np.float32) / np.float32(255.0)
+_LUT_U16 = np.arange(65536, dtype=np.float32) / np.float32(65535.0)
+
+
+@cc.export("u8_to_unit_f32", _unit_f32(_u1_3d))
+def u8_to_unit_f32(src):
+    h, w, c = src.shape
+    dst = np.empty((h, w, c), dtype=np.float32)
+    mn = np.float32(np.inf)
+    mx = np.float32(-np.inf)
+    for i in range(h):
+        for j in range(w):
+            for k in range(c):
+                v = _LUT_U8[src[i, j, k]]
+                dst[i, j, k] = v
+                mn = min(mn, v)
+                mx = max(mx, v)
+    return dst, mn, mx
+
+
+@cc.export("u16_to_unit_f32", _unit_f32(_u2_3d))
+def u16_to_unit_f32(src):
+    h, w, c = src.shape
+    dst = np.empty((h, w, c), dtype=np.float32)
+    mn = np.float32(np.inf)
+    mx = np.float32(-np.inf)
+    for i in range(h):
+        for j in range(w):
+            for k in range(c):
+                v = _LUT_U16[src[i, j, k]]
+                dst[i, j, k] = v
+                mn = min(mn, v)
+                mx = max(mx, v)
+    return dst, mn, mx
+
+
+@cc.export("f_to_unit_f32", _unit_f32(_f8_3d))
+def f_to_unit_f32(src):
+    h, w, c = src.shape
+    dst = np.empty((h, w, c), dtype=np.float32)
+    mn = np.float32(np.inf)
+    mx = np.float32(-np.inf)
+    for i in range(h):
+        for j in range(w):
+            for k in range(c):
+                v = np.float32(src[i, j, k])
+                dst[i, j, k] = v
+                mn = min(mn, v)
+                mx = max(mx, v)
+    return dst, mn, mx
+
+
+@cc.export("in_unit_range", types.boolean(_f4_3d))
+def in_unit_range(src):
+    flat = src.ravel()
+    for i in range(flat.size):
+        v = flat[i]
+        if v < 0.0 or v > 1.0:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    cc.compile()
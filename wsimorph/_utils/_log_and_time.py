@@ -1,11 +1,16 @@
 # type: ignore
 
 import logging
+import os
 import time
 from functools import wraps
 from typing import Any, Callable
 
-from humanize.time import precisedelta
+
+def _fmt(elapsed: float) -> str:
+    if elapsed < 1:
+        return f"{elapsed * 1000:.1f} ms"
+    return f"{elapsed:.2f} s"
 
 
 def setup_logger() -> logging.Logger:
@@ -28,20 +33,26 @@ WSIMORPH_CLI_LOGGER = setup_logger()
 def log_and_time(message: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     if not isinstance(message, str):
         raise TypeError("Message must be a string.")
+    if os.environ.get("WSIMORPH_DISABLE_TIMING"):
+        # Opt-out for production pipelines where even the clock reads and
+        # logger dispatches around hot functions are measurable: leave the
+        # decorated function unwrapped.
+        return lambda func: func
 
     def decorator(func) -> Callable[..., Any]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start = time.time()
-            WSIMORPH_CLI_LOGGER.info(f"[STARTED] {message}")
+            start = time.perf_counter_ns()
+            WSIMORPH_CLI_LOGGER.info("[STARTED] %s", message)
             result = func(*args, **kwargs)
-            end = time.time()
-            elapsed = end - start
-            print_time = precisedelta(
-                elapsed, minimum_unit="milliseconds" if elapsed < 1 else "seconds"
-            )
-            WSIMORPH_CLI_LOGGER.info(f"[COMPLETED] {message} in {print_time}.")
+            elapsed_ns = time.perf_counter_ns() - start
+            elapsed = elapsed_ns * 1e-9
+            if WSIMORPH_CLI_LOGGER.isEnabledFor(logging.INFO):
+                WSIMORPH_CLI_LOGGER.info(
+                    "[COMPLETED] %s in %s.", message, _fmt(elapsed)
+                )
             wrapper.elapsed_time = elapsed
+            wrapper.elapsed_time_ns = elapsed_ns
             return result
 
         return wrapper
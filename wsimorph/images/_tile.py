@@ -1,8 +1,53 @@
+from functools import lru_cache
+
 import numpy as np
 
+from ._tile_kernels import (
+    _f_to_unit_f32,
+    _in_unit_range,
+    _u8_batch_to_unit_f32,
+    _u8_to_unit_f32,
+    _u16_to_unit_f32,
+)
 from ._wsi import WSI
 
 
+@lru_cache(maxsize=None)
+def _make_validator(level_count: int):
+    """
+    Generates a specialized coordinate validator with the parent WSI's level
+    count baked in as a constant.
+
+    Compiling the checks once per level count removes the attribute lookup
+    and bound-method dispatch that a generic validator would pay on every
+    tile construction; the result is cached so each distinct level count is
+    compiled only once.
+
+    :param level_count: The level count of the parent whole-slide image.
+    :return: A function validating (y_start, x_start, level) tuples.
+    """
+    source = (
+        "def _validate(y_start, x_start, level):\n"
+        "    if type(y_start) is not int:\n"
+        '        raise TypeError("Y start must be an integer.")\n'
+        "    if y_start < 0:\n"
+        '        raise ValueError("Y start must be greater than or equal to zero.")\n'
+        "    if type(x_start) is not int:\n"
+        '        raise TypeError("X start must be an integer.")\n'
+        "    if x_start < 0:\n"
+        '        raise ValueError("X start must be greater than or equal to zero.")\n'
+        "    if type(level) is not int:\n"
+        '        raise TypeError("Level must be an integer.")\n'
+        f"    if level < 0 or level >= {level_count}:\n"
+        "        raise ValueError(\n"
+        '            "Level must be greater than or equal to zero and less than the level count of the parent WSI."\n'
+        "        )\n"
+    )
+    namespace: dict = {}
+    exec(source, namespace)
+    return namespace["_validate"]
+
+
 class Tile:
     """
     Represents a single image tile extracted from a whole-slide image (WSI).
@@ -11,9 +56,13 @@ class Tile:
     position, resolution level, and parent WSI. This class ensures the image
     data is validated and normalized for compatibility with downstream processing.
 
-    :ivar image: The 3D image ndarray representing the tile data. Must be normalized
-        to the range [0, 1].
+    :ivar image: The 3D float32 image ndarray representing the tile data,
+        normalized to the range [0, 1]. For unsigned integer inputs the
+        conversion is performed lazily on first access and cached.
     :type image: numpy.ndarray
+    :ivar image_u8: The raw 3D uint8 image ndarray the tile was constructed
+        from. Only available for tiles constructed from uint8 data.
+    :type image_u8: numpy.ndarray
     :ivar y_start: The y-coordinate of the top-left corner of the tile in the
         parent WSI. Must be a non-negative integer.
     :type y_start: int
@@ -31,14 +80,26 @@ class Tile:
         corresponds to the last axis of the image data.
     :type num_channels: int
     """
+
+    __slots__ = (
+        "_image",
+        "_image_raw",
+        "_y_start",
+        "_x_start",
+        "_level",
+        "_parent_wsi",
+        "_num_channels",
+    )
+
     def __init__(
         self, image: np.ndarray, y_start: int, x_start: int, level: int, parent_wsi: WSI
     ):
         """
         Initializes the object with the given image patch and related metadata.
 
-        :param image: A 3D ndarray containing the image patch data. Must be in a compatible
-            format and normalized to the range [0, 1].
+        :param image: A 3D ndarray, or array-like convertible via `np.asarray`
+            without a copy, containing the image patch data. Must be in a
+            compatible format and normalized to the range [0, 1].
         :param y_start: The y-coordinate of the top-left corner of the image patch within
             the parent whole-slide image. Must be a non-negative integer.
         :param x_start: The x-coordinate of the top-left corner of the image patch within
@@ -49,49 +110,176 @@ class Tile:
         :param parent_wsi: The parent whole-slide image (WSI) object that provides context
             for the image patch. Must be a valid instance of the WSI class.
 
-        :raises TypeError: Raised if `image` is not a numpy ndarray, `y_start` or `x_start`
-            is not an integer, or `parent_wsi` is not an instance of the WSI class.
+        :raises TypeError: Raised if `y_start` or `x_start` is not an integer, or
+            `parent_wsi` is not an instance of the WSI class.
         :raises ValueError: Raised if `image` is not a 3D array, `y_start` or `x_start` is
             not non-negative, `level` is not within valid bounds, `image` does not have a
             compatible dtype, or if it is not normalized to the range [0, 1].
         """
-        if not isinstance(image, np.ndarray):
-            raise TypeError("Image must be a numpy array.")
-        if not image.ndim == 3:
+        image = np.asarray(image)
+        if image.ndim != 3:
             raise ValueError("Image must be a 3D numpy array.")
-        if not isinstance(y_start, int):
-            raise TypeError("Y start must be an integer.")
-        if not y_start >= 0:
-            raise ValueError("Y start must be greater than or equal to zero.")
-        if not isinstance(x_start, int):
-            raise TypeError("X start must be an integer.")
-        if not x_start >= 0:
-            raise ValueError("X start must be greater than or equal to zero.")
-        if not isinstance(level, int):
-            raise TypeError("Level must be an integer.")
         if not isinstance(parent_wsi, WSI):
             raise TypeError("Parent WSI must be a WSI object.")
-        if level < 0 or level >= parent_wsi.level_count:
-            raise ValueError(
-                "Level must be greater than or equal to zero and less than the level count of the parent WSI."
-            )
-        if image.dtype == np.uint8:
-            image = image.astype(np.float32) / 255
-        if image.dtype == np.uint16:
-            image = image.astype(np.float32) / 65535
-        if not np.issubdtype(image.dtype, np.floating): raise TypeError("Image must be a of a compatible dtype.")
-        if (image.max() > 1) or (image.min() < 0): raise ValueError("Image must be normalized to [0, 1].")
-        self._image = image
+        _make_validator(parent_wsi.level_count)(y_start, x_start, level)
+        if image.dtype == np.uint8 or image.dtype == np.uint16:
+            # Unsigned integer inputs normalize into [0, 1] by construction,
+            # so the raw buffer is kept and converted lazily on first access.
+            self._image_raw = image
+            self._image = None
+        elif image.dtype == np.float64:
+            image, image_min, image_max = _f_to_unit_f32(image)
+            if (image_max > 1) or (image_min < 0):
+                raise ValueError("Image must be normalized to [0, 1].")
+            self._image_raw = None
+            self._image = image
+        elif np.issubdtype(image.dtype, np.floating):
+            # Numba cannot type float widths other than float32/float64
+            # (e.g. float16, longdouble), so narrow with NumPy first.
+            if image.dtype != np.float32:
+                image = image.astype(np.float32)
+            if not _in_unit_range(image):
+                raise ValueError("Image must be normalized to [0, 1].")
+            self._image_raw = None
+            self._image = image
+        else:
+            raise TypeError("Image must be a of a compatible dtype.")
+        # Mark the stored buffer read-only so consumers can alias the
+        # returned array freely without defensive copies.
+        image.setflags(write=False)
         self._y_start = y_start
         self._x_start = x_start
         self._level = level
         self._parent_wsi = parent_wsi
         self._num_channels = image.shape[2]
 
+    @classmethod
+    def from_batch(
+        cls,
+        images: np.ndarray,
+        y_starts: np.ndarray,
+        x_starts: np.ndarray,
+        level: int,
+        parent_wsi: WSI,
+    ) -> list["Tile"]:
+        """
+        Constructs a list of tiles from a contiguous batch of uint8 image
+        patches, amortizing validation and normalization over the batch.
+
+        The whole (N, H, W, C) block is converted to float32 in a single
+        parallel pass and each tile receives a view into the shared result,
+        avoiding the per-patch allocation and scan that constructing tiles
+        one at a time would incur.
+
+        :param images: A 4D uint8 ndarray of shape (N, H, W, C) containing
+            the stacked image patches.
+        :param y_starts: A 1D array of N non-negative y-coordinates, one per
+            patch.
+        :param x_starts: A 1D array of N non-negative x-coordinates, one per
+            patch.
+        :param level: The resolution level shared by all patches. Must be an
+            integer greater than or equal to zero and less than the level
+            count of the parent whole-slide image.
+        :param parent_wsi: The parent WSI object the patches were extracted
+            from.
+        :return: A list of N tiles sharing the batch's backing buffer.
+        :rtype: list[Tile]
+
+        :raises TypeError: Raised if `images` is not a numpy ndarray, if its
+            dtype is not uint8, if `y_starts` or `x_starts` do not have an
+            integer dtype, if `level` is not an integer, or if `parent_wsi`
+            is not an instance of the WSI class.
+        :raises ValueError: Raised if `images` is not a 4D array, if
+            `y_starts` or `x_starts` do not have one entry per patch or
+            contain negative values, or if `level` is not within valid
+            bounds.
+        """
+        if not isinstance(images, np.ndarray):
+            raise TypeError("Images must be a numpy array.")
+        if images.ndim != 4:
+            raise ValueError("Images must be a 4D numpy array.")
+        if images.dtype != np.uint8:
+            raise TypeError("Images must be of dtype uint8.")
+        y_starts = np.asarray(y_starts)
+        x_starts = np.asarray(x_starts)
+        num_tiles = images.shape[0]
+        if y_starts.shape != (num_tiles,):
+            raise ValueError("Y starts must have one entry per image.")
+        if x_starts.shape != (num_tiles,):
+            raise ValueError("X starts must have one entry per image.")
+        if not np.issubdtype(y_starts.dtype, np.integer):
+            raise TypeError("Y starts must be integers.")
+        if not np.issubdtype(x_starts.dtype, np.integer):
+            raise TypeError("X starts must be integers.")
+        if (y_starts < 0).any():
+            raise ValueError("Y starts must be greater than or equal to zero.")
+        if (x_starts < 0).any():
+            raise ValueError("X starts must be greater than or equal to zero.")
+        if type(level) is not int:
+            raise TypeError("Level must be an integer.")
+        if not isinstance(parent_wsi, WSI):
+            raise TypeError("Parent WSI must be a WSI object.")
+        if level < 0 or level >= parent_wsi.level_count:
+            raise ValueError(
+                "Level must be greater than or equal to zero and less than the level count of the parent WSI."
+            )
+        batch = _u8_batch_to_unit_f32(np.ascontiguousarray(images))
+        return [
+            cls._unsafe(
+                batch[i], int(y_starts[i]), int(x_starts[i]), level, parent_wsi
+            )
+            for i in range(num_tiles)
+        ]
+
+    @classmethod
+    def _unsafe(
+        cls,
+        image: np.ndarray,
+        y_start: int,
+        x_start: int,
+        level: int,
+        parent_wsi: WSI,
+    ) -> "Tile":
+        """
+        Constructs a tile without any validation or normalization. Intended
+        for trusted internal callers that already hold a normalized float32
+        image, skipping the per-instance checks in `__init__`.
+
+        :param image: A 3D float32 ndarray normalized to the range [0, 1].
+        :param y_start: The y-coordinate of the top-left corner of the tile.
+        :param x_start: The x-coordinate of the top-left corner of the tile.
+        :param level: The resolution level of the tile in the parent WSI.
+        :param parent_wsi: The parent WSI object.
+        :return: The constructed tile.
+        :rtype: Tile
+        """
+        tile = cls.__new__(cls)
+        image.setflags(write=False)
+        tile._image = image
+        tile._image_raw = None
+        tile._y_start = y_start
+        tile._x_start = x_start
+        tile._level = level
+        tile._parent_wsi = parent_wsi
+        tile._num_channels = image.shape[2]
+        return tile
+
     @property
     def image(self) -> np.ndarray:
+        if self._image is None:
+            if self._image_raw.dtype == np.uint8:
+                self._image, _, _ = _u8_to_unit_f32(self._image_raw)
+            else:
+                self._image, _, _ = _u16_to_unit_f32(self._image_raw)
+            self._image.setflags(write=False)
         return self._image
 
+    @property
+    def image_u8(self) -> np.ndarray:
+        if self._image_raw is None or self._image_raw.dtype != np.uint8:
+            raise ValueError("Tile does not hold uint8 image data.")
+        return self._image_raw
+
     @property
     def y_start(self) -> int:
         return self._y_start
@@ -0,0 +1,154 @@
+import numpy as np
+from numba import njit, prange
+
+try:
+    from . import _wsimorph_kernels as _aot
+except ImportError:
+    _aot = None
+
+# Normalization lookup tables: a gather replaces the per-pixel
+# integer-to-float conversion and divide. The uint16 table is 256KB and
+# stays resident in L2.
+_LUT_U8 = np.arange(256, dtype=np.float32) / np.float32(255.0)
+_LUT_U16 = np.arange(65536, dtype=np.float32) / np.float32(65535.0)
+
+
+@njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+def _u8_to_unit_f32(src):  # pragma: no cover
+    """
+    Converts a uint8 image to float32 in [0, 1] and tracks its value range
+    in a single fused pass over the buffer.
+
+    :param src: A 3D uint8 ndarray.
+    :return: A tuple of the converted float32 ndarray, the minimum value and
+        the maximum value.
+    """
+    h, w, c = src.shape
+    dst = np.empty((h, w, c), dtype=np.float32)
+    if src.size == 0:
+        # Match the AOT kernels, whose never-updated sentinels pass the
+        # [0, 1] range check for empty inputs.
+        return dst, np.float32(np.inf), np.float32(-np.inf)
+    row_mn = np.empty(h, dtype=np.float32)
+    row_mx = np.empty(h, dtype=np.float32)
+    for i in prange(h):
+        # Seeding from the first element (safe behind the emptiness guard)
+        # avoids reducing over infinity sentinels, which fastmath's no-inf
+        # assumption leaves undefined.
+        mn = _LUT_U8[src[i, 0, 0]]
+        mx = mn
+        for j in range(w):
+            for k in range(c):
+                v = _LUT_U8[src[i, j, k]]
+                dst[i, j, k] = v
+                mn = min(mn, v)
+                mx = max(mx, v)
+        row_mn[i] = mn
+        row_mx[i] = mx
+    return dst, row_mn.min(), row_mx.max()
+
+
+@njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+def _u16_to_unit_f32(src):  # pragma: no cover
+    """
+    Converts a uint16 image to float32 in [0, 1] and tracks its value range
+    in a single fused pass over the buffer.
+
+    :param src: A 3D uint16 ndarray.
+    :return: A tuple of the converted float32 ndarray, the minimum value and
+        the maximum value.
+    """
+    h, w, c = src.shape
+    dst = np.empty((h, w, c), dtype=np.float32)
+    if src.size == 0:
+        return dst, np.float32(np.inf), np.float32(-np.inf)
+    row_mn = np.empty(h, dtype=np.float32)
+    row_mx = np.empty(h, dtype=np.float32)
+    for i in prange(h):
+        mn = _LUT_U16[src[i, 0, 0]]
+        mx = mn
+        for j in range(w):
+            for k in range(c):
+                v = _LUT_U16[src[i, j, k]]
+                dst[i, j, k] = v
+                mn = min(mn, v)
+                mx = max(mx, v)
+        row_mn[i] = mn
+        row_mx[i] = mx
+    return dst, row_mn.min(), row_mx.max()
+
+
+@njit(boundscheck=False, cache=True)
+def _in_unit_range(src):  # pragma: no cover
+    """
+    Checks that every element of a floating point image lies in [0, 1],
+    exiting on the first out-of-range element.
+
+    :param src: A floating point ndarray.
+    :return: True if all elements lie in [0, 1], False otherwise.
+    """
+    flat = src.ravel()
+    for i in range(flat.size):
+        v = flat[i]
+        if v < 0.0 or v > 1.0:
+            return False
+    return True
+
+
+@njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+def _f_to_unit_f32(src):  # pragma: no cover
+    """
+    Downcasts a floating point image to float32 and tracks its value range
+    in a single fused pass over the buffer.
+
+    :param src: A 3D floating point ndarray.
+    :return: A tuple of the converted float32 ndarray, the minimum value and
+        the maximum value.
+    """
+    h, w, c = src.shape
+    dst = np.empty((h, w, c), dtype=np.float32)
+    if src.size == 0:
+        return dst, np.float32(np.inf), np.float32(-np.inf)
+    row_mn = np.empty(h, dtype=np.float32)
+    row_mx = np.empty(h, dtype=np.float32)
+    for i in prange(h):
+        mn = np.float32(src[i, 0, 0])
+        mx = mn
+        for j in range(w):
+            for k in range(c):
+                v = np.float32(src[i, j, k])
+                dst[i, j, k] = v
+                mn = min(mn, v)
+                mx = max(mx, v)
+        row_mn[i] = mn
+        row_mx[i] = mx
+    return dst, row_mn.min(), row_mx.max()
+
+
+if _aot is not None:  # pragma: no cover
+    # Prefer the ahead-of-time compiled kernels when the extension built by
+    # wsimorph._utils._compile_kernels is present, avoiding JIT warm-up on
+    # the first tile.
+    _u8_to_unit_f32 = _aot.u8_to_unit_f32
+    _u16_to_unit_f32 = _aot.u16_to_unit_f32
+    _f_to_unit_f32 = _aot.f_to_unit_f32
+    _in_unit_range = _aot.in_unit_range
+
+
+@njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+def _u8_batch_to_unit_f32(src):  # pragma: no cover
+    """
+    Converts a batch of uint8 images to float32 in [0, 1] in a single
+    parallel pass over the whole (N, H, W, C) block.
+
+    :param src: A 4D uint8 ndarray of stacked image patches.
+    :return: The converted float32 ndarray with the same shape.
+    """
+    n, h, w, c = src.shape
+    dst = np.empty((n, h, w, c), dtype=np.float32)
+    for i in prange(n):
+        for j in range(h):
+            for k in range(w):
+                for m in range(c):
+                    dst[i, j, k, m] = _LUT_U8[src[i, j, k, m]]
+    return dst
@@ -1,7 +1,80 @@
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 from openslide import OpenSlide
 
+try:
+    from tiffslide import TiffSlide
+except ImportError:
+    TiffSlide = None
+
+_TIFFSLIDE_SUFFIXES = {".tif", ".tiff", ".svs"}
+
+
+def _open(path: Path):
+    """
+    Opens a whole-slide image with the fastest available backend.
+
+    Pyramidal TIFFs are opened with tiffslide when it is installed, which
+    is faster to open and read than OpenSlide and avoids its memory growth
+    in long-running tile loops. All other formats, or environments without
+    tiffslide, fall back to OpenSlide. Both backends expose the same
+    ``properties``, ``level_count``, ``dimensions``, ``level_dimensions``
+    and ``level_downsamples`` interface.
+
+    :param path: Resolved path to the whole-slide image file.
+    :return: An open slide handle.
+    """
+    if TiffSlide is not None and path.suffix.lower() in _TIFFSLIDE_SUFFIXES:
+        return TiffSlide(path)
+    return OpenSlide(path)
+
+
+def _get_property(properties, name: str):
+    """
+    Looks up a backend-namespaced slide property, checking the openslide
+    and tiffslide prefixes in turn.
+
+    :param properties: The slide's property mapping.
+    :param name: The property name without its backend prefix.
+    :return: The property value, or None if neither backend provides it.
+    """
+    value = properties.get(f"openslide.{name}")
+    if value is None:
+        value = properties.get(f"tiffslide.{name}")
+    return value
+
+
+@lru_cache(maxsize=128)
+def _read_wsi_meta(path: Path) -> dict:
+    """
+    Reads the metadata of a whole-slide image, opening the slide once per
+    path and caching the result for subsequent ``WSI`` constructions.
+
+    :param path: Resolved path to the whole-slide image file.
+    :return: A dictionary of slide metadata.
+    """
+    with _open(path) as slide:
+        vendor = _get_property(slide.properties, "vendor")
+        mpp_x = _get_property(slide.properties, "mpp-x")
+        mpp_y = _get_property(slide.properties, "mpp-y")
+        level_dimensions = np.asarray(slide.level_dimensions, dtype=np.int64)
+        level_downsamples = np.asarray(slide.level_downsamples, dtype=np.float64)
+        # The cached metadata is shared across WSI instances, so the arrays
+        # are marked read-only.
+        level_dimensions.setflags(write=False)
+        level_downsamples.setflags(write=False)
+        return {
+            "vendor": vendor if vendor is not None else "Unknown",
+            "level_count": slide.level_count,
+            "dimensions": slide.dimensions,
+            "level_dimensions": level_dimensions,
+            "level_downsamples": level_downsamples,
+            "mpp_x": float(mpp_x) if mpp_x is not None else float(0),
+            "mpp_y": float(mpp_y) if mpp_y is not None else float(0),
+        }
+
 
 class WSI:
     """
@@ -25,12 +98,12 @@ class WSI:
     :ivar dimensions: The dimensions of the base resolution level of the WSI as
         (width, height).
     :type dimensions: tuple[int, int]
-    :ivar level_dimensions: A tuple containing the dimensions (width, height)
-        of each resolution level.
-    :type level_dimensions: tuple[tuple[int, int], ...]
-    :ivar level_downsamples: A tuple specifying the downsample factors for each
-        resolution level.
-    :type level_downsamples: tuple[float, ...]
+    :ivar level_dimensions: A read-only (level_count, 2) int64 array containing
+        the dimensions (width, height) of each resolution level.
+    :type level_dimensions: numpy.ndarray
+    :ivar level_downsamples: A read-only float64 array specifying the downsample
+        factor of each resolution level.
+    :type level_downsamples: numpy.ndarray
     :ivar mpp: The microns per pixel (pixel spacing), if available; otherwise 0.
     :type mpp: float
     :ivar mpp_x: The horizontal spacing in microns per pixel, if available;
@@ -40,11 +113,27 @@ class WSI:
         otherwise 0.
     :type mpp_y: float
     """
+
+    __slots__ = (
+        "_path",
+        "_name",
+        "_stem",
+        "_vendor",
+        "_level_count",
+        "_dimensions",
+        "_level_dimensions",
+        "_level_downsamples",
+        "_mpp",
+        "_mpp_x",
+        "_mpp_y",
+        "_inv_pixel_size",
+    )
+
     def __init__(self, path: str) -> None:
         """
         Initializes a new instance of the class, resolving the given path,
         verifying its existence, and extracting properties from the file
-        using OpenSlide.
+        using tiffslide for pyramidal TIFFs or OpenSlide otherwise.
 
         :param path: Path to the file to be processed
         :type path: str
@@ -60,21 +149,22 @@ class WSI:
         self._path = wsi_path
         self._name = wsi_path.name
         self._stem = wsi_path.stem
-        with OpenSlide(wsi_path) as slide:
-            vendor = slide.properties.get("openslide.vendor")
-            self._vendor = vendor if vendor is not None else "Unknown"
-            self._level_count = slide.level_count
-            self._dimensions = slide.dimensions
-            self._level_dimensions = slide.level_dimensions
-            self._level_downsamples = slide.level_downsamples
-            mpp_y = slide.properties.get("openslide.mpp-y")
-            mpp_x = slide.properties.get("openslide.mpp-x")
-            self._mpp_y = float(mpp_y) if mpp_y is not None else float(0)
-            self._mpp_x = float(mpp_x) if mpp_x is not None else float(0)
-            if (self._mpp_x == self._mpp_y) and (self._mpp_x > 0):
-                self._mpp = self._mpp_x
-            else:
-                self._mpp = float(0)
+        meta = _read_wsi_meta(wsi_path)
+        self._vendor = meta["vendor"]
+        self._level_count = meta["level_count"]
+        self._dimensions = meta["dimensions"]
+        self._level_dimensions = meta["level_dimensions"]
+        self._level_downsamples = meta["level_downsamples"]
+        self._mpp_x = meta["mpp_x"]
+        self._mpp_y = meta["mpp_y"]
+        if (self._mpp_x == self._mpp_y) and (self._mpp_x > 0):
+            self._mpp = self._mpp_x
+        else:
+            self._mpp = float(0)
+        self._inv_pixel_size = tuple(
+            1.0 / (self._mpp * float(downsample)) if self._mpp > 0 else float(0)
+            for downsample in self._level_downsamples
+        )
 
     def pixels_from_microns(self, microns: float, level: int) -> float:
         """
@@ -111,7 +201,21 @@ class WSI:
             raise ValueError("Microns must be greater than zero.")
         if self.mpp == 0:
             raise ValueError("WSI has no pixel size information.")
-        return microns / (self.mpp * self.level_downsamples[level])
+        return self._pixels_from_microns_unchecked(microns, level)
+
+    def _pixels_from_microns_unchecked(self, microns: float, level: int) -> float:
+        """
+        Converts a distance in microns to pixels without validating the
+        arguments. Intended for trusted internal callers on hot paths where
+        `pixels_from_microns` validation has already been performed.
+
+        :param microns: The distance in microns to be converted.
+        :param level: The resolution level for which the conversion is
+            performed.
+        :return: The distance in pixels at the specified resolution level.
+        :rtype: float
+        """
+        return microns * self._inv_pixel_size[level]
 
     @property
     def path(self) -> Path:
@@ -138,11 +242,11 @@ class WSI:
         return self._dimensions
 
     @property
-    def level_dimensions(self) -> tuple[tuple[int, int], ...]:
+    def level_dimensions(self) -> np.ndarray:
         return self._level_dimensions
 
     @property
-    def level_downsamples(self) -> tuple[float, ...]:
+    def level_downsamples(self) -> np.ndarray:
         return self._level_downsamples
 
     @property